@@ -35,4 +35,12 @@ LP_CONFIG = {
     'max_height': 100,
     'contrast_enhance': 1.5,
     'brightness_enhance': 10
-}
\ No newline at end of file
+}
+
+# Video stream settings
+STREAM_CONFIG = {
+    'reconnect_delay': 1,  # seconds before first reconnect attempt
+    'max_reconnect_delay': 30,  # cap for exponential backoff
+    'max_reconnect_attempts': None,  # None to retry forever
+    'read_timeout': 5  # seconds to wait for a new frame
+}
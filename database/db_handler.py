@@ -17,7 +17,7 @@ class MongoDBHandler:
         violation_id = str(uuid.uuid4())
         record = {
             '_id': violation_id,
-            'timestamp': datetime.now(),
+            'timestamp': violation_data.get('timestamp', datetime.now()),
             'license_plate': violation_data.get('license_plate', 'UNKNOWN'),
             'violation_type': violation_data.get('violation_type'),
             'location': violation_data.get('location'),
@@ -106,10 +106,14 @@ class ViolationDetector:
         
         return []
     
-    def check_violations(self, frame, vehicles, yellow_boxes, zebra_crossings):
+    def check_violations(self, frame, vehicles, yellow_boxes, zebra_crossings, capture_time=None):
         """Check for vehicles violating traffic rules"""
         violations = []
-        current_time = datetime.now()
+        # Measure durations on the clock the frames were captured with
+        if capture_time is not None:
+            current_time = datetime.fromtimestamp(capture_time)
+        else:
+            current_time = datetime.now()
         
         # Check yellow box violations
         for box in yellow_boxes:
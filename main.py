@@ -9,11 +9,12 @@ from detectors.violation_detector import ViolationDetector
 from detectors.license_plate_recognizer import LicensePlateRecognizer
 from utils.file_handler import FileHandler
 from utils.helpers import draw_violation_info, draw_detection_zones
+from utils.stream_reader import StreamReader
 
 class TrafficViolationSystem:
-    def __init__(self, video_source=0):
+    def __init__(self, video_source=0, live=None):
         self.video_source = video_source
-        self.cap = cv2.VideoCapture(video_source)
+        self.stream = StreamReader(video_source, live=live)
         self.running = False
         
         # Initialize components
@@ -23,7 +24,7 @@ class TrafficViolationSystem:
         self.file_handler = FileHandler()
         
         # Buffer for storing frames when violation occurs
-        self.violation_frames = deque(maxlen=100)  # Store up to 100 frames
+        self.violation_frames = deque(maxlen=100)  # Store up to 100 (capture_time, frame) pairs
         
         # Track current violations
         self.current_violations = {}
@@ -31,16 +32,23 @@ class TrafficViolationSystem:
     def start(self):
         """Start the violation detection system"""
         self.running = True
+        self.stream.start()
         print("Traffic violation detection system started")
         
         while self.running:
-            ret, frame = self.cap.read()
+            # Short timeout so 'q' still works while the stream reconnects
+            ret, frame, capture_time = self.stream.read(timeout=0.1)
             if not ret:
-                print("Error reading frame")
-                break
+                if not self.stream.is_running():
+                    print("Video stream ended")
+                    break
+                # Stream is reconnecting, keep the UI responsive
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+                continue
             
             # Store frame in buffer
-            self.violation_frames.append(frame.copy())
+            self.violation_frames.append((capture_time, frame.copy()))
             
             # Detect vehicles
             vehicles = self.violation_detector.detect_vehicles(frame)
@@ -51,12 +59,12 @@ class TrafficViolationSystem:
             
             # Check for violations
             violations = self.violation_detector.check_violations(
-                frame, vehicles, yellow_boxes, zebra_crossings
+                frame, vehicles, yellow_boxes, zebra_crossings, capture_time
             )
             
             # Process violations
             for violation in violations:
-                self._process_violation(violation, frame)
+                self._process_violation(violation, frame, capture_time)
             
             # Draw detection zones
             frame = draw_detection_zones(frame, yellow_boxes, zebra_crossings)
@@ -75,7 +83,7 @@ class TrafficViolationSystem:
         # Clean up
         self.stop()
     
-    def _process_violation(self, violation, frame):
+    def _process_violation(self, violation, frame, capture_time):
         """Process a detected violation"""
         vehicle_id = violation['vehicle_id']
         
@@ -99,16 +107,21 @@ class TrafficViolationSystem:
                 'violation_type': violation['type'],
                 'duration': violation['duration'],
                 'location': violation['location'],
-                'license_plate': license_plate
+                'license_plate': license_plate,
+                'timestamp': datetime.fromtimestamp(capture_time)
             }
             
             # Save image
             image_path = self.file_handler.save_violation_image(frame, vehicle_id)
             violation_data['image_path'] = image_path
             
-            # Save video clip (last 3 seconds)
-            clip_frames = list(self.violation_frames)[-60:]  # Assuming 20fps, 3 seconds
-            video_path = self.file_handler.save_violation_video(clip_frames, vehicle_id)
+            # Save video clip (last 3 seconds of captured frames)
+            clip = [(t, f) for t, f in self.violation_frames if capture_time - t <= 3]
+            clip_frames = [f for _, f in clip]
+            # Frames arrive at processing speed, derive the real frame rate
+            clip_span = clip[-1][0] - clip[0][0] if clip else 0
+            fps = (len(clip) - 1) / clip_span if clip_span > 0 else 20
+            video_path = self.file_handler.save_violation_video(clip_frames, vehicle_id, fps=fps)
             violation_data['video_path'] = video_path
             
             # Store in database
@@ -127,8 +140,9 @@ class TrafficViolationSystem:
     def stop(self):
         """Stop the violation detection system"""
         self.running = False
-        self.cap.release()
+        self.stream.stop()
         cv2.destroyAllWindows()
+        print(f"Stream stats: {self.stream.get_stats()}")
         self.db_handler.close_connection()
         print("System stopped")
 
@@ -142,5 +156,8 @@ if __name__ == "__main__":
     # For RTSP stream
     # system = TrafficViolationSystem("rtsp://username:password@ip_address:port")
     
+    # For other live sources (device path, GStreamer pipeline)
+    # system = TrafficViolationSystem("/dev/video0", live=True)
+    
     system = TrafficViolationSystem()
     system.start()
\ No newline at end of file
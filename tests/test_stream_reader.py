@@ -0,0 +1,177 @@
+import time
+import unittest
+
+from utils.stream_reader import StreamReader
+
+class FakeCapture:
+    """Stand-in for cv2.VideoCapture serving numbered frames"""
+
+    def __init__(self, frames, opened=True, fps=20, grab_delay=0):
+        self.frames = frames
+        self.opened = opened
+        self.fps = fps
+        self.grab_delay = grab_delay
+        self.position = 0
+
+    def isOpened(self):
+        return self.opened
+
+    def grab(self):
+        time.sleep(self.grab_delay)
+        if self.position >= self.frames:
+            return False
+        self.position += 1
+        return True
+
+    def retrieve(self):
+        return True, self.position
+
+    def get(self, prop):
+        return (self.position - 1) * 1000.0 / self.fps
+
+    def release(self):
+        self.opened = False
+
+def read_all(reader, delay=0):
+    """Read frames until the stream ends"""
+    frames = []
+    while True:
+        ret, frame, _ = reader.read(timeout=1)
+        if not ret:
+            if not reader.is_running():
+                return frames
+            continue
+        frames.append(frame)
+        time.sleep(delay)
+
+class StreamReaderTest(unittest.TestCase):
+    def test_file_delivers_every_frame(self):
+        reader = StreamReader("traffic.mp4", capture_factory=lambda src: FakeCapture(50))
+        reader.start()
+
+        frames = read_all(reader, delay=0.001)
+
+        self.assertEqual(frames, list(range(1, 51)))
+        self.assertFalse(reader.is_running())
+        self.assertEqual(reader.get_stats()['frames_dropped'], 0)
+        reader.stop()
+
+    def test_file_timestamps_follow_video_position(self):
+        reader = StreamReader("traffic.mp4", capture_factory=lambda src: FakeCapture(3, fps=10))
+        reader.start()
+
+        timestamps = []
+        while len(timestamps) < 3:
+            ret, _, timestamp = reader.read(timeout=1)
+            self.assertTrue(ret)
+            timestamps.append(timestamp)
+
+        self.assertAlmostEqual(timestamps[2] - timestamps[0], 0.2)
+        reader.stop()
+
+    def test_missing_file_ends_stream(self):
+        reader = StreamReader("missing.mp4", capture_factory=lambda src: FakeCapture(0, opened=False))
+        reader.start()
+
+        self.assertEqual(read_all(reader), [])
+        self.assertEqual(reader.get_stats()['reconnects'], 0)
+        reader.stop()
+
+    def test_live_read_failure_backs_off_and_gives_up(self):
+        opened = []
+
+        def factory(src):
+            opened.append(time.time())
+            return FakeCapture(0)
+
+        reader = StreamReader("rtsp://camera/stream", capture_factory=factory)
+        reader.reconnect_delay = 0.02
+        reader.max_reconnect_attempts = 3
+        reader.start()
+
+        self.assertEqual(read_all(reader), [])
+        self.assertEqual(len(opened), 4)
+        self.assertEqual(reader.get_stats()['reconnects'], 3)
+        gaps = [b - a for a, b in zip(opened, opened[1:])]
+        self.assertGreaterEqual(gaps[0], 0.02)
+        self.assertGreater(gaps[1], gaps[0])
+        self.assertGreater(gaps[2], gaps[1])
+        reader.stop()
+
+    def test_live_backoff_resets_after_frame(self):
+        captures = [FakeCapture(5), FakeCapture(0, opened=False), FakeCapture(5),
+                    FakeCapture(0, opened=False), FakeCapture(5)]
+        opened = []
+
+        def factory(src):
+            opened.append(time.time())
+            return captures.pop(0) if captures else FakeCapture(0)
+
+        reader = StreamReader(0, capture_factory=factory)
+        reader.reconnect_delay = 0.05
+        reader.max_reconnect_attempts = 2
+        reader.start()
+
+        read_all(reader)
+
+        # Without the reset the third failure in a row gives up after 10 frames
+        self.assertEqual(reader.get_stats()['frames_captured'], 15)
+        gaps = [b - a for a, b in zip(opened, opened[1:])]
+        self.assertGreaterEqual(gaps[1], 0.1)
+        # Delay is back to reconnect_delay after the second capture's frames
+        self.assertGreaterEqual(gaps[2], 0.05)
+        self.assertLess(gaps[2], 0.1)
+        reader.stop()
+
+    def test_live_override_keeps_latest_frame_and_reconnects(self):
+        captures = [FakeCapture(50, grab_delay=0.001), FakeCapture(50, grab_delay=0.001)]
+        reader = StreamReader("/dev/video0", live=True,
+                              capture_factory=lambda src: captures.pop(0) if captures else FakeCapture(0, opened=False))
+        reader.reconnect_delay = 0.01
+        reader.max_reconnect_attempts = 1
+        reader.start()
+
+        frames = read_all(reader, delay=0.01)
+
+        stats = reader.get_stats()
+        self.assertEqual(stats['reconnects'], 2)
+        self.assertEqual(stats['frames_captured'], 100)
+        self.assertGreater(stats['frames_dropped'], 0)
+        self.assertEqual(stats['frames_dropped'], 100 - len(frames))
+        reader.stop()
+
+    def test_stop_during_backoff_does_not_count_reconnect(self):
+        reader = StreamReader(0, capture_factory=lambda src: FakeCapture(0, opened=False))
+        reader.reconnect_delay = 10
+        reader.start()
+
+        time.sleep(0.05)
+        reader.stop()
+
+        self.assertEqual(reader.get_stats()['reconnects'], 0)
+
+    def test_live_counts_dropped_frames(self):
+        reader = StreamReader(0, capture_factory=lambda src: FakeCapture(50, grab_delay=0.001))
+        reader.max_reconnect_attempts = 0
+        reader.start()
+
+        frames = read_all(reader, delay=0.01)
+
+        stats = reader.get_stats()
+        self.assertEqual(stats['frames_captured'], 50)
+        self.assertLess(len(frames), 50)
+        self.assertEqual(stats['frames_dropped'], 50 - len(frames))
+        reader.stop()
+
+    def test_stop_does_not_wait_for_blocked_grab(self):
+        reader = StreamReader("rtsp://camera/stream", capture_factory=lambda src: FakeCapture(5, grab_delay=2))
+        reader.read_timeout = 0.1
+        reader.start()
+
+        start = time.time()
+        reader.stop()
+
+        self.assertLess(time.time() - start, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import cv2
+import time
+import threading
+from config.settings import STREAM_CONFIG
+
+class StreamReader:
+    """Read frames from a video source on a background thread.
+
+    For live sources (device index, stream URL, or live=True) only the most
+    recent frame is kept, so slow processing never works on stale frames
+    buffered by the capture backend; frames overwritten before they were
+    read are counted as dropped. A live source that fails to open or read is reopened with
+    exponential backoff. Video files are delivered frame by frame and end
+    the stream when exhausted or if they cannot be opened.
+    """
+
+    def __init__(self, video_source=0, capture_factory=cv2.VideoCapture, live=None):
+        self.video_source = video_source
+        # None guesses from the source, see is_live()
+        self.live = live
+        self.capture_factory = capture_factory
+        self.cap = None
+
+        self.reconnect_delay = STREAM_CONFIG['reconnect_delay']
+        self.max_reconnect_delay = STREAM_CONFIG['max_reconnect_delay']
+        self.max_reconnect_attempts = STREAM_CONFIG['max_reconnect_attempts']
+        self.read_timeout = STREAM_CONFIG['read_timeout']
+
+        # Latest frame and its metadata, guarded by the condition's lock
+        self._condition = threading.Condition()
+        self._frame = None
+        self._timestamp = None
+        self._frame_id = 0
+        self._last_read_id = 0
+
+        # Backoff state, reset once a frame is actually retrieved
+        self._failures = 0
+        self._delay = self.reconnect_delay
+        self._start_time = None
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+
+        self.running = False
+        self._thread = None
+
+    def start(self):
+        """Open the source and start the capture thread"""
+        self.running = True
+        self._delay = self.reconnect_delay
+        self._start_time = time.time()
+        self._thread = threading.Thread(target=self._update, daemon=True)
+        self._thread.start()
+        return self
+
+    def read(self, timeout=None):
+        """Wait for a frame newer than the last one read.
+
+        Returns (ret, frame, timestamp). For live sources timestamp is the
+        wall-clock time at which the frame was grabbed; for video files it
+        is the start time plus the frame's position in the video.
+        """
+        if timeout is None:
+            timeout = self.read_timeout
+
+        with self._condition:
+            has_new_frame = self._condition.wait_for(
+                lambda: self._frame_id != self._last_read_id or not self.running,
+                timeout=timeout
+            )
+            if not has_new_frame or self._frame_id == self._last_read_id:
+                return False, None, None
+
+            self._last_read_id = self._frame_id
+            # Let a file producer blocked on this frame continue
+            self._condition.notify_all()
+            return True, self._frame, self._timestamp
+
+    def get_stats(self):
+        """Return capture statistics"""
+        with self._condition:
+            return {
+                'frames_captured': self.frames_captured,
+                'frames_dropped': self.frames_dropped,
+                'reconnects': self.reconnects
+            }
+
+    def is_running(self):
+        """Check if the capture thread is still delivering frames"""
+        return self.running
+
+    def is_live(self):
+        """Check if the source is a live stream.
+
+        Uses the live argument when given, otherwise treats a camera index
+        or a stream URL as live and anything else as a file.
+        """
+        if self.live is not None:
+            return self.live
+        return isinstance(self.video_source, int) or '://' in str(self.video_source)
+
+    def stop(self):
+        """Stop the capture thread and release the source"""
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.read_timeout)
+            if self._thread.is_alive():
+                # Still blocked in the backend; the thread releases the
+                # capture itself once the call returns
+                print(f"Capture thread for {self.video_source} did not stop in time")
+                return
+            self._thread = None
+
+        self._release()
+
+    def _update(self):
+        """Capture loop run on the background thread"""
+        while self.running:
+            if self.cap is None and not self._open():
+                break
+
+            ret = self.cap.grab()
+            timestamp = time.time()
+            if ret:
+                ret, frame = self.cap.retrieve()
+
+            if not ret:
+                self._release()
+                if not self.is_live():
+                    # End of a video file, nothing to reconnect to
+                    break
+                print(f"Error reading frame from {self.video_source}")
+                if not self._backoff():
+                    break
+                continue
+
+            self._failures = 0
+            self._delay = self.reconnect_delay
+
+            if not self.is_live():
+                timestamp = self._start_time + self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+
+            with self._condition:
+                if self.is_live():
+                    if self._frame_id != self._last_read_id:
+                        # Previous frame was never read
+                        self.frames_dropped += 1
+                else:
+                    # Files are not real time, wait until the frame is consumed
+                    self._condition.wait_for(
+                        lambda: self._frame_id == self._last_read_id or not self.running
+                    )
+                    if not self.running:
+                        break
+                self._frame = frame
+                self._timestamp = timestamp
+                self._frame_id += 1
+                self.frames_captured += 1
+                self._condition.notify_all()
+
+        self._release()
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+    def _open(self):
+        """Open the capture, returns False if the stream should end"""
+        while self.running:
+            self.cap = self.capture_factory(self.video_source)
+            if self.cap.isOpened():
+                return True
+
+            self._release()
+            if not self.is_live():
+                print(f"Error opening video file {self.video_source}")
+                return False
+
+            print(f"Could not open {self.video_source}")
+            if not self._backoff():
+                return False
+
+        return False
+
+    def _backoff(self):
+        """Wait before reconnecting, returns False when giving up"""
+        self._failures += 1
+        if self.max_reconnect_attempts is not None and self._failures > self.max_reconnect_attempts:
+            print(f"Giving up on {self.video_source} after {self.max_reconnect_attempts} reconnect attempts")
+            return False
+
+        print(f"Reconnecting to {self.video_source} in {self._delay:.1f}s")
+        # Sleep on the condition so stop() wakes us immediately
+        with self._condition:
+            self._condition.wait_for(lambda: not self.running, timeout=self._delay)
+            if self.running:
+                self.reconnects += 1
+        self._delay = min(self._delay * 2, self.max_reconnect_delay)
+        return self.running
+
+    def _release(self):
+        """Release the underlying capture if open"""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None